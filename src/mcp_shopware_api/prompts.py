@@ -1,9 +1,108 @@
-import json
+import asyncio
+from typing import List, Tuple
 
+import httpx
+import orjson
 from fastmcp import FastMCP
 
 from .tools import ShopwareAuth
 
+# Constant part of the ready-to-ship order search. The per-call state ID
+# filter is injected on top of this template, so the large literal is only
+# allocated once at import time.
+_ORDER_SEARCH_CRITERIA_TEMPLATE = {
+    "fields": [
+        "orderNumber",
+        "orderDateTime",
+        "amountTotal",
+        "currencyFactor",
+        "stateMachineState",
+        "orderCustomer",
+        "deliveries",
+        "lineItems",
+        "transactions",
+        "currency",
+    ],
+    "associations": {
+        "orderCustomer": {"fields": ["firstName", "lastName", "email"]},
+        "deliveries": {
+            "fields": ["shippingDateEarliest", "shippingDateLatest"],
+            "associations": {
+                "stateMachineState": {"fields": ["name", "technicalName"]},
+                "shippingOrderAddress": {
+                    "fields": [
+                        "firstName",
+                        "lastName",
+                        "street",
+                        "zipcode",
+                        "city",
+                        "countryId",
+                    ],
+                    "associations": {"country": {"fields": ["name"]}},
+                },
+            },
+        },
+        "lineItems": {
+            "fields": [
+                "label",
+                "quantity",
+                "unitPrice",
+                "totalPrice",
+                "type",
+            ],
+            "filter": [{"type": "equals", "field": "type", "value": "product"}],
+            "associations": {"product": {"fields": ["name", "productNumber"]}},
+        },
+        "stateMachineState": {"fields": ["name", "technicalName"]},
+        "transactions": {
+            "fields": ["amount"],
+            "associations": {
+                "stateMachineState": {"fields": ["name", "technicalName"]}
+            },
+        },
+        "currency": {"fields": ["symbol", "isoCode"]},
+    },
+    "sort": [{"field": "orderDateTime", "order": "DESC"}],
+    "limit": 50,
+    # The total count is never shown - skip the extra count query
+    "total-count-mode": "none",
+}
+
+
+_SYSTEM_PROMPT = """You are analyzing Shopware order data to identify orders ready for shipping.
+
+TASK: Format the following order data into a clear, readable table showing orders that are paid but not yet shipped.
+
+REQUIRED TABLE COLUMNS:
+1. Order Number
+2. Product Names (show quantity × unit price for each item)
+3. Delivery Name and Address (full shipping address)
+4. Order Date (formatted as YYYY-MM-DD)
+5. Current Order Status
+6. Payment Status
+7. Delivery Status
+
+FORMATTING INSTRUCTIONS:
+- Use a clean table format with proper alignment
+- For products: show "ProductName (Qty: X × $Price = $Total)"
+- For address: show "Name, Street, City, ZIP, Country"
+- Sort by order date (newest first)
+- If no orders found, clearly state "No ready-to-ship orders found"
+- Highlight any important status information
+
+DATA TO PROCESS:
+"""
+
+_ORDERS_ERROR_TEMPLATE = """Error retrieving orders: Status {code}
+
+Please inform the user that there was an error retrieving ready-to-ship orders from the Shopware API.
+Error details: {text}"""
+
+_SEARCH_ERROR_TEMPLATE = """Error executing ready-to-ship orders search: {error}
+
+Please inform the user that there was an error executing the ready-to-ship orders search.
+Technical details: {error}"""
+
 
 def register_prompts(mcp: FastMCP, shopware_auth: ShopwareAuth) -> None:
     """Register all MCP prompts with the FastMCP instance"""
@@ -15,77 +114,16 @@ def register_prompts(mcp: FastMCP, shopware_auth: ShopwareAuth) -> None:
         Automatically retrieve and format all Shopware orders that are paid but not yet shipped.
         This prompt executes the API call and provides instructions for formatting the results.
         """
-        try:
-            # First, get state machine definitions to extract UUIDs
-            state_machine_criteria = {
-                "filter": [
-                    {
-                        "type": "equalsAny",
-                        "field": "technicalName",
-                        "value": ["order_delivery.state", "order_transaction.state"],
-                    }
-                ],
-                "associations": {
-                    "states": {"sort": [{"field": "name", "order": "ASC"}]}
-                },
-            }
-
-            state_machine_response = await shopware_auth.make_authenticated_request(
-                "POST", "/search/state-machine", json=state_machine_criteria
-            )
-
-            if state_machine_response.status_code != 200:
-                return f"Error retrieving state machines: {state_machine_response.text}"
-
-            state_machines = state_machine_response.json()
 
-            # Extract UUIDs for relevant states
-            paid_transaction_states = []
-            open_delivery_states = []
+        async def search_orders(
+            state_ids: Tuple[List[str], List[str]],
+        ) -> httpx.Response:
+            """Execute the order search for the given (paid, open) state IDs."""
+            paid_transaction_states, open_delivery_states = state_ids
 
-            # First, build a lookup map of all states from the included section
-            states_lookup = {}
-            for item in state_machines.get("included", []):
-                if item.get("type") == "state_machine_state":
-                    states_lookup[item.get("id")] = item.get("attributes", {})
-
-            # Now process the state machines and look up the actual state details
-            for machine in state_machines.get("data", []):
-                machine_attrs = machine.get("attributes", {})
-
-                if machine_attrs.get("technicalName") == "order_transaction.state":
-                    # Get state IDs from relationships
-                    state_refs = (
-                        machine.get("relationships", {})
-                        .get("states", {})
-                        .get("data", [])
-                    )
-                    for state_ref in state_refs:
-                        state_id = state_ref.get("id")
-                        state_attrs = states_lookup.get(state_id, {})
-                        tech_name = state_attrs.get("technicalName", "")
-                        if tech_name in ["paid"]:
-                            paid_transaction_states.append(state_id)
-
-                elif machine_attrs.get("technicalName") == "order_delivery.state":
-                    # Get state IDs from relationships
-                    state_refs = (
-                        machine.get("relationships", {})
-                        .get("states", {})
-                        .get("data", [])
-                    )
-                    for state_ref in state_refs:
-                        state_id = state_ref.get("id")
-                        state_attrs = states_lookup.get(state_id, {})
-                        tech_name = state_attrs.get("technicalName", "")
-                        if tech_name in ["open"]:
-                            open_delivery_states.append(state_id)
-
-            if not paid_transaction_states or not open_delivery_states:
-                return "Error: Could not find required state machine state UUIDs"
-
-            # Define search criteria for paid but not shipped orders with UUID filtering
+            # Inject the per-call state ID filter on top of the shared template
             search_criteria = {
+                **_ORDER_SEARCH_CRITERIA_TEMPLATE,
                 "filter": [
                     {
                         "type": "equalsAny",
@@ -98,110 +136,59 @@ def register_prompts(mcp: FastMCP, shopware_auth: ShopwareAuth) -> None:
                         "value": open_delivery_states,
                     },
                 ],
-                "fields": [
-                    "orderNumber",
-                    "orderDateTime",
-                    "amountTotal",
-                    "currencyFactor",
-                    "stateMachineState",
-                    "orderCustomer",
-                    "deliveries",
-                    "lineItems",
-                    "transactions",
-                    "currency",
-                ],
-                "associations": {
-                    "orderCustomer": {"fields": ["firstName", "lastName", "email"]},
-                    "deliveries": {
-                        "fields": ["shippingDateEarliest", "shippingDateLatest"],
-                        "associations": {
-                            "stateMachineState": {"fields": ["name", "technicalName"]},
-                            "shippingOrderAddress": {
-                                "fields": [
-                                    "firstName",
-                                    "lastName",
-                                    "street",
-                                    "zipcode",
-                                    "city",
-                                    "countryId",
-                                ],
-                                "associations": {"country": {"fields": ["name"]}},
-                            },
-                        },
-                    },
-                    "lineItems": {
-                        "fields": [
-                            "label",
-                            "quantity",
-                            "unitPrice",
-                            "totalPrice",
-                            "type",
-                        ],
-                        "filter": [
-                            {"type": "equals", "field": "type", "value": "product"}
-                        ],
-                        "associations": {
-                            "product": {"fields": ["name", "productNumber"]}
-                        },
-                    },
-                    "stateMachineState": {"fields": ["name", "technicalName"]},
-                    "transactions": {
-                        "fields": ["amount"],
-                        "associations": {
-                            "stateMachineState": {"fields": ["name", "technicalName"]}
-                        },
-                    },
-                    "currency": {"fields": ["symbol", "isoCode"]},
-                },
-                "sort": [{"field": "orderDateTime", "order": "DESC"}],
-                "limit": 50,
             }
 
-            # Execute the order search
-            endpoint = "/search/order"
-            response = await shopware_auth.make_authenticated_request(
-                "POST", endpoint, json=search_criteria
+            return await shopware_auth.make_authenticated_request(
+                "POST", "/search/order", json=search_criteria
             )
 
-            if response.status_code == 200:
-                orders_data = response.json()
-
-                # Create the combined prompt with data and instructions
-                system_prompt = """You are analyzing Shopware order data to identify orders ready for shipping.
-
-TASK: Format the following order data into a clear, readable table showing orders that are paid but not yet shipped.
-
-REQUIRED TABLE COLUMNS:
-1. Order Number
-2. Product Names (show quantity × unit price for each item)
-3. Delivery Name and Address (full shipping address)
-4. Order Date (formatted as YYYY-MM-DD)
-5. Current Order Status
-6. Payment Status
-7. Delivery Status
-
-FORMATTING INSTRUCTIONS:
-- Use a clean table format with proper alignment
-- For products: show "ProductName (Qty: X × $Price = $Total)"
-- For address: show "Name, Street, City, ZIP, Country"
-- Sort by order date (newest first)
-- If no orders found, clearly state "No ready-to-ship orders found"
-- Highlight any important status information
-
-DATA TO PROCESS:
-"""
+        try:
+            # Resolve the paid/open state machine state UUIDs. These are
+            # stable per Shopware instance, so ShopwareAuth caches them and
+            # only hits the API when the cache is cold or expired. If we have
+            # previously cached IDs, run the (possibly cached) resolution and
+            # the order search concurrently using the speculative IDs - the
+            # two requests then overlap instead of running back-to-back.
+            try:
+                speculative_ids = shopware_auth.stale_shipping_state_ids()
+                if speculative_ids is not None:
+                    state_ids, response = await asyncio.gather(
+                        shopware_auth.get_shipping_state_ids(),
+                        search_orders(speculative_ids),
+                    )
+                    if state_ids != speculative_ids:
+                        # The refreshed IDs differ from the speculative ones,
+                        # so the search result is stale - retry once
+                        response = await search_orders(state_ids)
+                else:
+                    state_ids = await shopware_auth.get_shipping_state_ids()
+                    response = await search_orders(state_ids)
+            except RuntimeError as e:
+                return f"Error: {str(e)}"
 
-                return f"{system_prompt}\n\n{json.dumps(orders_data, indent=2)}"
+            if response.status_code == 200:
+                # orjson parses straight from bytes, several times faster
+                # than stdlib json on Shopware's nested JSON:API payloads
+                orders_data = orjson.loads(response.content)
+
+                # No matching orders - skip pretty-printing the (still
+                # sizeable) empty JSON:API envelope entirely
+                if not orders_data.get("data"):
+                    return f"{_SYSTEM_PROMPT}\n\nNo ready-to-ship orders found"
+
+                # Only the entities themselves matter to the formatting
+                # instructions - drop the rest of the JSON:API envelope
+                # (meta, links, aggregations) before re-serializing
+                trimmed = {
+                    "data": orders_data["data"],
+                    "included": orders_data.get("included", []),
+                }
+                orders_json = orjson.dumps(trimmed, option=orjson.OPT_INDENT_2).decode()
+                return f"{_SYSTEM_PROMPT}\n\n{orders_json}"
             else:
-                error_prompt = f"""Error retrieving orders: Status {response.status_code}
-                
-Please inform the user that there was an error retrieving ready-to-ship orders from the Shopware API.
-Error details: {response.text}"""
-                return error_prompt
+                return _ORDERS_ERROR_TEMPLATE.format(
+                    code=response.status_code, text=response.text
+                )
 
         except Exception as e:
-            error_prompt = f"""Error executing ready-to-ship orders search: {str(e)}
-            
-Please inform the user that there was an error executing the ready-to-ship orders search.
-Technical details: {str(e)}"""
-            return error_prompt
+            return _SEARCH_ERROR_TEMPLATE.format(error=str(e))
@@ -1,5 +1,8 @@
+import logging
 import os
 import sys
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from dotenv import load_dotenv
 from fastmcp import FastMCP
@@ -10,52 +13,66 @@ try:
     from .tools import ShopwareAuth, register_tools
 except ImportError:
     # If relative imports fail, try absolute imports
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
     from mcp_shopware_api.prompts import register_prompts
     from mcp_shopware_api.tools import ShopwareAuth, register_tools
 
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-# Debug information
-print(f"Python executable: {sys.executable}", file=sys.stderr)
-print(f"Working directory: {os.getcwd()}", file=sys.stderr)
-print(f"Script path: {__file__}", file=sys.stderr)
 
-# Environment validation
-store_url = os.getenv("STORE_URL")
-api_key = os.getenv("API_KEY")
-api_secret = os.getenv("API_SECRET")
+def _build_server() -> FastMCP:
+    """Load configuration and construct the fully-wired FastMCP server.
 
-print(
-    f"Environment variables: STORE_URL={bool(store_url)}, API_KEY={bool(api_key)}, API_SECRET={bool(api_secret)}",
-    file=sys.stderr,
-)
+    Kept out of module scope so importing this module (e.g. for tool
+    discovery or tests) stays cheap and does not require credentials.
+    """
+    load_dotenv()
 
-if not all([store_url, api_key, api_secret]):
-    print(
-        "ERROR: Missing required environment variables: STORE_URL, API_KEY, API_SECRET",
-        file=sys.stderr,
-    )
-    raise ValueError(
-        "Missing required environment variables: STORE_URL, API_KEY, API_SECRET"
+    logger.debug("Python executable: %s", sys.executable)
+    logger.debug("Working directory: %s", os.getcwd())
+    logger.debug("Script path: %s", __file__)
+
+    # Environment validation
+    store_url = os.getenv("STORE_URL")
+    api_key = os.getenv("API_KEY")
+    api_secret = os.getenv("API_SECRET")
+
+    logger.debug(
+        "Environment variables: STORE_URL=%s, API_KEY=%s, API_SECRET=%s",
+        bool(store_url),
+        bool(api_key),
+        bool(api_secret),
     )
 
-# Initialize FastMCP server and auth
-mcp: FastMCP = FastMCP("mcp-shopware-api")
+    if store_url is None or api_key is None or api_secret is None:
+        raise ValueError(
+            "Missing required environment variables: STORE_URL, API_KEY, API_SECRET"
+        )
+
+    shopware_auth = ShopwareAuth(store_url, api_key, api_secret)
 
-# Ensure environment variables are not None
-if store_url is None or api_key is None or api_secret is None:
-    raise ValueError("Environment variables cannot be None")
+    @asynccontextmanager
+    async def lifespan(app: FastMCP) -> AsyncIterator[None]:
+        """Close the pooled HTTP client cleanly on server shutdown."""
+        try:
+            yield
+        finally:
+            await shopware_auth.aclose()
 
-shopware_auth = ShopwareAuth(store_url, api_key, api_secret)
+    # Initialize FastMCP server
+    mcp: FastMCP = FastMCP("mcp-shopware-api", lifespan=lifespan)
 
-# Register tools and prompts
-register_tools(mcp, shopware_auth)
-register_prompts(mcp, shopware_auth)
+    # Register tools and prompts
+    register_tools(mcp, shopware_auth)
+    register_prompts(mcp, shopware_auth)
 
-def main():
+    return mcp
+
+
+def main() -> None:
     """Main entry point for the MCP server."""
-    mcp.run()
+    _build_server().run()
+
 
 if __name__ == "__main__":
     main()
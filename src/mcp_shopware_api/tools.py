@@ -3,25 +3,33 @@ import functools
 import json
 import logging
 import os
+import random
 import sys
+import time
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import httpx
+import orjson
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
 load_dotenv()
 
 # Enhanced logging configuration for debugging
+_MCP_DEBUG_ENABLED = os.getenv("MCP_DEBUG", "").lower() in ("true", "1")
+
 handlers: List[logging.Handler] = [logging.StreamHandler(sys.stderr)]
 
 # Only add file logging when MCP_DEBUG environment variable is set to true or 1
-if os.getenv("MCP_DEBUG", "").lower() in ("true", "1"):
+if _MCP_DEBUG_ENABLED:
     handlers.append(logging.FileHandler("/tmp/mcp-shopware-debug.log", mode="a"))
 
+# Full DEBUG logging only when MCP_DEBUG is on; otherwise WARNING, so the
+# isEnabledFor guards on the request/response logging paths actually skip
+# the per-call formatting (pretty-printed bodies, summary re-parses)
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.DEBUG if _MCP_DEBUG_ENABLED else logging.WARNING,
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     handlers=handlers,
 )
@@ -31,40 +39,323 @@ mcp_logger = logging.getLogger("MCP")
 api_logger = logging.getLogger("SHOPWARE_API")
 
 
+def _parse_response(response: httpx.Response) -> Any:
+    """Parse a JSON response body with orjson, straight from the bytes."""
+    return orjson.loads(response.content)
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_endpoint(endpoint: str) -> str:
+    """Ensure the endpoint starts with a slash.
+
+    Agents hit the same handful of endpoints over and over, so the
+    normalized form is memoized; repeat calls are a single dict hit
+    instead of a prefix check plus a string concatenation.
+    """
+    return endpoint if endpoint.startswith("/") else "/" + endpoint
+
+
+@functools.lru_cache(maxsize=8)
+def _sync_headers(
+    indexing_behavior: Optional[str], skip_trigger_flow: bool
+) -> Tuple[Tuple[str, str], ...]:
+    """Return the performance header pairs for a sync request.
+
+    Only four combinations of indexing behavior and flow skipping exist,
+    so the pairs are memoized as immutable tuples; callers build a dict
+    from them only when there is something to send.
+    """
+    headers = []
+    if indexing_behavior is not None:
+        headers.append(("indexing-behavior", indexing_behavior))
+    if skip_trigger_flow:
+        headers.append(("sw-skip-trigger-flow", "1"))
+    return tuple(headers)
+
+
+@functools.lru_cache(maxsize=128)
+def _sync_operation_builder(
+    entity: str, action: str
+) -> Callable[[Any], Dict[str, Any]]:
+    """Return a builder for the per-key sync operation envelope.
+
+    High-volume imports call the sync tool repeatedly with the same
+    (entity, action) pair; the closure pre-binds both strings so each
+    call only allocates the envelope dict around its payload.
+    """
+
+    def build(payload: Any) -> Dict[str, Any]:
+        return {"entity": entity, "action": action, "payload": payload}
+
+    return build
+
+
+def _coerce_json_arg(name: str, value: Any) -> Tuple[Any, Optional[str]]:
+    """Normalize a tool argument that may arrive as a dict or a JSON string.
+
+    Returns (value, error); callers bail out with the error string when it
+    is not None. Dicts - the common programmatic case - pass through
+    untouched, so only string inputs pay a parse (via orjson).
+    """
+    if isinstance(value, str):
+        try:
+            return orjson.loads(value), None
+        except orjson.JSONDecodeError as e:
+            return None, f"Invalid JSON in {name}: {str(e)}"
+    return value, None
+
+
+def _summarize_arg(value: Any) -> Any:
+    """Shorten bulky argument values for log records.
+
+    Bulk-sync payloads can hold tens of thousands of entries; logging
+    needs their size, not their contents, so large collections and long
+    strings collapse to a placeholder while small values pass through.
+    """
+    if isinstance(value, (list, tuple)) and len(value) > 10:
+        return f"<{type(value).__name__} of {len(value)} items>"
+    if isinstance(value, str) and len(value) > 256:
+        return f"<str of {len(value)} chars>"
+    return value
+
+
 # MCP Communication logger
 def log_mcp_call(func: Callable) -> Callable:
-    """Decorator to log all MCP tool calls with parameters and results"""
+    """Decorator to log all MCP tool calls with parameters and results.
+
+    When MCP_DEBUG is disabled the function is returned unwrapped, so tool
+    calls carry no logging-wrapper overhead at all.
+    """
+    if not _MCP_DEBUG_ENABLED:
+        return func
 
     @functools.wraps(func)
     async def wrapper(*args: Any, **kwargs: Any) -> Any:
         tool_name = func.__name__
-        mcp_logger.info(f"🔧 MCP TOOL CALLED: {tool_name}")
-        mcp_logger.info(f"📥 INPUT ARGS: {args}")
-        mcp_logger.info(f"📥 INPUT KWARGS: {kwargs}")
+        # Lazy %s formatting so args/kwargs/results are only stringified
+        # when the corresponding level is actually enabled
+        # Summarize instead of stringifying whole payloads - a bulk sync
+        # argument can be a 50k-entity list
+        if mcp_logger.isEnabledFor(logging.INFO):
+            mcp_logger.info("🔧 MCP TOOL CALLED: %s", tool_name)
+            mcp_logger.info("📥 INPUT ARGS: %s", [_summarize_arg(arg) for arg in args])
+            mcp_logger.info(
+                "📥 INPUT KWARGS: %s",
+                {key: _summarize_arg(value) for key, value in kwargs.items()},
+            )
 
         try:
             result = await func(*args, **kwargs)
-            mcp_logger.info(f"📤 OUTPUT SUCCESS: {tool_name}")
-            mcp_logger.debug(f"📤 OUTPUT DATA: {result}")
+            mcp_logger.info("📤 OUTPUT SUCCESS: %s", tool_name)
+            if mcp_logger.isEnabledFor(logging.DEBUG):
+                mcp_logger.debug("📤 OUTPUT DATA: %s", result)
             return result
         except Exception as e:
-            mcp_logger.error(f"❌ OUTPUT ERROR: {tool_name} - {str(e)}")
+            mcp_logger.error("❌ OUTPUT ERROR: %s - %s", tool_name, e)
             raise
 
     return wrapper
 
 
+# Result templates shared by the two search tools
+_SEARCH_SUCCESS = "Search successful for entity '{entity}'. Retrieved {count} items (total: {total}). Result: {result}"
+_SEARCH_FAILURE = "Search failed for entity '{entity}' with status {status}: {text}"
+_SEARCH_ERROR = "Error searching entity '{entity}': {error}"
+_SEARCH_IDS_SUCCESS = "ID search successful for entity '{entity}'. Found {count} matching IDs (total: {total}). Result: {result}"
+_SEARCH_IDS_FAILURE = (
+    "ID search failed for entity '{entity}' with status {status}: {text}"
+)
+_SEARCH_IDS_ERROR = "Error searching entity IDs for '{entity}': {error}"
+
+# Result templates for the write tools (PATCH/DELETE/sync)
+_PATCH_OK_204 = "PATCH request successful for endpoint '{endpoint}'. Entity updated (no content returned)."
+_PATCH_OK = "PATCH request successful for endpoint '{endpoint}'. Result: {result}"
+_PATCH_FAILURE = (
+    "PATCH request failed for endpoint '{endpoint}' with status {status}: {text}"
+)
+_PATCH_ERROR = "Error making PATCH request to '{endpoint}': {error}"
+_DELETE_OK_204 = (
+    "DELETE request successful for endpoint '{endpoint}'. Entity deleted successfully."
+)
+_DELETE_OK = "DELETE request successful for endpoint '{endpoint}'. Result: {result}"
+_DELETE_FAILURE = (
+    "DELETE request failed for endpoint '{endpoint}' with status {status}: {text}"
+)
+_DELETE_ERROR = "Error making DELETE request to '{endpoint}': {error}"
+_SYNC_FAILURE = "Sync operation failed with status {status}: {text}"
+_SYNC_ERROR = "Error executing sync operation for entity '{entity}': {error}"
+
+# Default filter applied to product searches when the caller provides no
+# filter of their own - mirrors the admin panel's parent-products-only view.
+# Kept as a tuple so the shared constant cannot be mutated by callers.
+_PRODUCT_PARENT_FILTER = ({"type": "equals", "field": "parentId", "value": None},)
+
+# How long the formatted get_available_entities result stays fresh (seconds)
+AVAILABLE_ENTITIES_TTL = 300.0
+
+# On-disk cache for the entity-name list plus the schema ETag, so fresh
+# processes can revalidate with a conditional GET instead of re-downloading
+# the megabyte-scale schema document
+_ENTITY_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "mcp-shopware", "entities.json"
+)
+
+
+def _load_entity_disk_cache() -> Tuple[Optional[str], Optional[List[str]]]:
+    """Return the persisted (etag, entity names), or (None, None) if absent."""
+    try:
+        with open(_ENTITY_CACHE_FILE, "rb") as cache_file:
+            cached = orjson.loads(cache_file.read())
+        return cached.get("etag"), cached.get("entities")
+    except (OSError, orjson.JSONDecodeError):
+        return None, None
+
+
+def _store_entity_disk_cache(etag: str, entities: List[str]) -> None:
+    """Persist the schema ETag and entity names; failures are non-fatal."""
+    try:
+        os.makedirs(os.path.dirname(_ENTITY_CACHE_FILE), exist_ok=True)
+        with open(_ENTITY_CACHE_FILE, "wb") as cache_file:
+            cache_file.write(orjson.dumps({"etag": etag, "entities": entities}))
+    except OSError:
+        # The disk cache is purely an optimization - never fail the tool
+        # call over an unwritable cache directory
+        pass
+
+
+# Status codes worth retrying: rate limiting and transient gateway errors
+_RETRYABLE_STATUS = frozenset({429, 502, 503, 504})
+
+# Valid values for the sync tool's action and indexing_behavior arguments;
+# frozensets give O(1) membership checks and cannot be mutated by callers
+_VALID_SYNC_ACTIONS = frozenset({"upsert", "delete"})
+_VALID_INDEXING_BEHAVIORS = frozenset({None, "use-queue-indexing", "disable-indexing"})
+
+# (machine technicalName, state technicalName) -> index into the cached
+# (paid_transaction_states, open_delivery_states) tuple
+_SHIPPING_STATE_TARGETS = {
+    ("order_transaction.state", "paid"): 0,
+    ("order_delivery.state", "open"): 1,
+}
+
+# Criteria for resolving the shipping-relevant state machine states. The
+# query is constant, so the literal is allocated once at import time.
+_SHIPPING_STATE_CRITERIA = {
+    "filter": [
+        {
+            "type": "multi",
+            "operator": "and",
+            "queries": [
+                {
+                    "type": "equalsAny",
+                    "field": "technicalName",
+                    "value": ["paid", "open"],
+                },
+                {
+                    "type": "equalsAny",
+                    "field": "stateMachine.technicalName",
+                    "value": ["order_transaction.state", "order_delivery.state"],
+                },
+            ],
+        }
+    ],
+    # The parent machine is still needed to tell transaction 'open' apart
+    # from delivery 'open'
+    "associations": {"stateMachine": {}},
+    "includes": {
+        "state_machine_state": ["id", "technicalName", "stateMachine"],
+        "state_machine": ["id", "technicalName"],
+    },
+    "total-count-mode": "none",
+}
+
+
 class ShopwareAuth:
+    # Slot-based attributes: faster access on the per-request hot path and
+    # a smaller per-instance footprint than a __dict__
+    __slots__ = (
+        "store_url",
+        "api_key",
+        "api_secret",
+        "access_token",
+        "_token_expires_monotonic",
+        "_default_headers",
+        "_refresh_lock",
+        "_request_semaphore",
+        "client",
+        "_state_cache",
+        "_state_cache_fetched_at",
+        "_state_cache_lock",
+        "_schema_cache",
+        "_entity_defs_index",
+    )
+
+    # How long cached state-machine state IDs stay valid before a refresh
+    STATE_CACHE_TTL = timedelta(hours=1)
+
+    # How long cached schema documents stay valid before a refetch
+    SCHEMA_CACHE_TTL = 3600.0
+
+    # Attempts per request before a transient failure is surfaced
+    MAX_RETRIES = 5
+
     def __init__(self, store_url: str, api_key: str, api_secret: str):
         self.store_url = store_url.rstrip("/")
         self.api_key = api_key
         self.api_secret = api_secret
         self.access_token: Optional[str] = None
-        self.token_expires_at: Optional[datetime] = None
-        self.client = httpx.AsyncClient()
+        # Monotonic deadline for the current token - cheaper to check per
+        # request than constructing datetime objects, and immune to
+        # wall-clock jumps
+        self._token_expires_monotonic: float = 0.0
+        # Default request headers, rebuilt once per token refresh instead of
+        # on every request
+        self._default_headers: Optional[Dict[str, str]] = None
+        # Collapses concurrent refresh attempts after expiry into a single
+        # OAuth request
+        self._refresh_lock = asyncio.Lock()
+        # Caps in-flight requests so bursty bulk operations are smoothed
+        # out instead of exhausting the connection pool or provoking
+        # rate-limit responses from Shopware
+        self._request_semaphore = asyncio.Semaphore(
+            int(os.getenv("SHOPWARE_MAX_CONCURRENCY", "20"))
+        )
+        # Shared pooled client reused for every request - keepalive
+        # connections and HTTP/2 multiplexing amortize the TCP/TLS
+        # handshake cost across tool calls
+        self.client = httpx.AsyncClient(
+            base_url=f"{self.store_url}/api",
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=60.0,
+            ),
+            timeout=httpx.Timeout(connect=5.0, read=30.0, write=30.0, pool=5.0),
+            # Shopware responses are multi-KB JSON - compressing them trades
+            # a little CPU for significantly fewer bytes over the wire
+            headers={
+                "Accept-Encoding": "gzip",
+                "Content-Type": "application/json",
+            },
+        )
+        # Cached (paid_transaction_states, open_delivery_states) state IDs.
+        # These UUIDs are stable per Shopware instance, so fetching them on
+        # every prompt invocation wastes a full HTTP round-trip.
+        self._state_cache: Optional[Tuple[List[str], List[str]]] = None
+        self._state_cache_fetched_at: Optional[datetime] = None
+        self._state_cache_lock = asyncio.Lock()
+        # Parsed schema documents (OpenAPI spec, entity definitions) keyed
+        # by endpoint - multi-MB payloads that only change with the
+        # Shopware version, so refetching them per tool call is wasteful
+        self._schema_cache: Dict[str, Tuple[float, Any]] = {}
+        # (document, normalized-name -> real key) index for the entity
+        # definitions, rebuilt only when the cached document changes
+        self._entity_defs_index: Optional[Tuple[Any, Dict[str, str]]] = None
 
     async def _request_new_token(self) -> None:
-        auth_url = f"{self.store_url}/api/oauth/token"
+        # Relative to the client's {store_url}/api base URL
+        auth_url = "/oauth/token"
         auth_data = {
             "grant_type": "client_credentials",
             "client_id": self.api_key,
@@ -74,11 +365,15 @@ class ShopwareAuth:
         try:
             response = await self.client.post(auth_url, json=auth_data)
             response.raise_for_status()
-            token_data = response.json()
+            token_data = _parse_response(response)
 
             self.access_token = token_data["access_token"]
             expires_in = token_data.get("expires_in", 3600)
-            self.token_expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
+            self._token_expires_monotonic = time.monotonic() + (expires_in - 60)
+            self._default_headers = {
+                "Authorization": f"Bearer {self.access_token}",
+                "Content-Type": "application/json",
+            }
 
             logger.info("Successfully obtained new access token")
 
@@ -87,12 +382,19 @@ class ShopwareAuth:
             raise
 
     async def get_valid_token(self) -> str:
+        # Lock-free fast path for the common valid-token case
         if (
             self.access_token is None
-            or self.token_expires_at is None
-            or datetime.now() >= self.token_expires_at
+            or time.monotonic() >= self._token_expires_monotonic
         ):
-            await self._request_new_token()
+            async with self._refresh_lock:
+                # Re-check after acquiring the lock - another coroutine may
+                # have refreshed the token while we were waiting
+                if (
+                    self.access_token is None
+                    or time.monotonic() >= self._token_expires_monotonic
+                ):
+                    await self._request_new_token()
 
         # After _request_new_token, access_token should be set
         assert self.access_token is not None
@@ -101,53 +403,420 @@ class ShopwareAuth:
     async def make_authenticated_request(
         self, method: str, endpoint: str, **kwargs: Any
     ) -> httpx.Response:
-        token = await self.get_valid_token()
-        headers = kwargs.get("headers", {})
-        headers.update(
-            {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+        await self.get_valid_token()
+        # get_valid_token guarantees a token, and with it the cached headers
+        assert self._default_headers is not None
+        caller_headers = kwargs.get("headers")
+        if caller_headers:
+            kwargs["headers"] = {**self._default_headers, **caller_headers}
+        else:
+            # Common case: pass the cached dict straight through, no copy
+            kwargs["headers"] = self._default_headers
+
+        # Log API request details; the pretty-printed body is only built
+        # when DEBUG is actually enabled
+        api_logger.info("🌐 API REQUEST: %s %s", method, endpoint)
+        if api_logger.isEnabledFor(logging.DEBUG):
+            if kwargs.get("params"):
+                api_logger.debug("🔍 REQUEST PARAMS: %s", kwargs["params"])
+            if kwargs.get("json"):
+                api_logger.debug(
+                    "📋 REQUEST BODY: %s", json.dumps(kwargs["json"], indent=2)
+                )
+
+        # Serialize request bodies with orjson instead of httpx's internal
+        # stdlib json encoding; the Content-Type header is already set.
+        # A None body means "no body" - httpx treats json=None the same
+        # way - and must not be serialized to a literal JSON null
+        if "json" in kwargs:
+            body = kwargs.pop("json")
+            if body is not None:
+                kwargs["content"] = orjson.dumps(body)
+
+        # The endpoint is resolved against the client's {store_url}/api base;
+        # the semaphore bounds how many requests are in flight at once.
+        # Transient failures - rate limiting, gateway errors, dropped
+        # connections - are retried with exponential backoff and jitter, so
+        # callers only ever see the final outcome
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                async with self._request_semaphore:
+                    response = await self.client.request(method, endpoint, **kwargs)
+            except httpx.TransportError as e:
+                if attempt == self.MAX_RETRIES - 1:
+                    raise
+                delay = min(2**attempt + random.random(), 30.0)
+                api_logger.warning(
+                    "🔁 TRANSPORT ERROR: %s %s (%s) - retrying in %.1fs",
+                    method,
+                    endpoint,
+                    e,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            if (
+                response.status_code in _RETRYABLE_STATUS
+                and attempt < self.MAX_RETRIES - 1
+            ):
+                # Honor the server's Retry-After when given, otherwise back
+                # off exponentially; either way cap the wait at 30s
+                retry_after = response.headers.get("retry-after")
+                if retry_after is not None and retry_after.isdigit():
+                    delay = min(float(retry_after), 30.0)
+                else:
+                    delay = min(2**attempt + random.random(), 30.0)
+                api_logger.warning(
+                    "🔁 RETRYABLE STATUS: %s %s -> %s - retrying in %.1fs",
+                    method,
+                    endpoint,
+                    response.status_code,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            break
+
+        # Log API response details; parsing/pretty-printing the body purely
+        # for logging is skipped when the level is disabled
+        api_logger.info(
+            "📡 API RESPONSE: %s %s -> %s", method, endpoint, response.status_code
         )
-        kwargs["headers"] = headers
+        if response.status_code >= 400:
+            api_logger.error("❌ ERROR RESPONSE: %s", response.text)
+        elif api_logger.isEnabledFor(logging.INFO):
+            # Only attempt to parse bodies the server declared as JSON -
+            # Shopware answers with application/json or, on the /search/*
+            # endpoints, application/vnd.api+json. The cheap substring
+            # check beats a try/except plus a second body decode for HTML
+            # error pages and empty 204 responses
+            content_type = response.headers.get("content-type", "")
+            if "json" in content_type:
+                try:
+                    response_data = _parse_response(response)
+                except (ValueError, orjson.JSONDecodeError):
+                    # bare except here would swallow cancellation; malformed
+                    # JSON despite the content-type is all we expect
+                    api_logger.debug("📦 RESPONSE DATA: %s", response.text)
+                else:
+                    if isinstance(response_data, dict) and "data" in response_data:
+                        data_count = (
+                            len(response_data["data"])
+                            if isinstance(response_data["data"], list)
+                            else 1
+                        )
+                        total = response_data.get("total", "unknown")
+                        api_logger.info(
+                            "📊 RESPONSE SUMMARY: %s items (total: %s)",
+                            data_count,
+                            total,
+                        )
+                    if api_logger.isEnabledFor(logging.DEBUG):
+                        api_logger.debug(
+                            "📦 RESPONSE DATA: %s",
+                            json.dumps(response_data, indent=2),
+                        )
+            elif api_logger.isEnabledFor(logging.DEBUG):
+                api_logger.debug("📦 RESPONSE DATA: %s", response.text)
 
-        url = f"{self.store_url}/api{endpoint}"
+        return response
 
-        # Log API request details
-        api_logger.info(f"🌐 API REQUEST: {method} {url}")
-        if kwargs.get("params"):
-            api_logger.debug(f"🔍 REQUEST PARAMS: {kwargs['params']}")
-        if kwargs.get("json"):
-            api_logger.debug(f"📋 REQUEST BODY: {json.dumps(kwargs['json'], indent=2)}")
+    async def get_cached_schema(
+        self, endpoint: str, ttl: float = SCHEMA_CACHE_TTL
+    ) -> Any:
+        """Return the parsed schema document at `endpoint`, cached with a TTL.
 
-        response = await self.client.request(method, url, **kwargs)
+        Used for the OpenAPI spec and the entity-definition schema, which
+        are large and effectively static per Shopware version.
+        """
+        cached = self._schema_cache.get(endpoint)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        response = await self.make_authenticated_request("GET", endpoint)
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"Failed to fetch {endpoint} with status "
+                f"{response.status_code}: {response.text}"
+            )
 
-        # Log API response details
-        api_logger.info(f"📡 API RESPONSE: {method} {url} -> {response.status_code}")
-        if response.status_code >= 400:
-            api_logger.error(f"❌ ERROR RESPONSE: {response.text}")
+        document = _parse_response(response)
+        self._schema_cache[endpoint] = (time.monotonic(), document)
+        return document
+
+    async def get_entity_definitions(self) -> Tuple[Any, Dict[str, str]]:
+        """Return the entity definitions plus a normalized-name key index.
+
+        The index maps lowercased, underscore-normalized entity names to the
+        real schema keys, so lookups are a single dict hit instead of a scan
+        over every key. It is rebuilt only when the cached document changes.
+        """
+        schema_data = await self.get_cached_schema("/_info/open-api-schema.json")
+        if (
+            self._entity_defs_index is None
+            or self._entity_defs_index[0] is not schema_data
+        ):
+            index = {key.lower().replace("-", "_"): key for key in schema_data}
+            self._entity_defs_index = (schema_data, index)
+        return schema_data, self._entity_defs_index[1]
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and release keepalive connections."""
+        await self.client.aclose()
+
+    async def get_shipping_state_ids(self) -> Tuple[List[str], List[str]]:
+        """Return (paid_transaction_states, open_delivery_states) state IDs.
+
+        The IDs are fetched from the state-machine endpoint once and cached
+        with a TTL, since they are stable per Shopware instance. The lock
+        prevents concurrent callers from all firing the same request when
+        the cache is cold.
+        """
+        cached = self._cached_state_ids()
+        if cached is not None:
+            return cached
+
+        async with self._state_cache_lock:
+            # Re-check after acquiring the lock - another coroutine may have
+            # refreshed the cache while we were waiting
+            cached = self._cached_state_ids()
+            if cached is not None:
+                return cached
+            return await self.refresh_state_cache()
+
+    def stale_shipping_state_ids(self) -> Optional[Tuple[List[str], List[str]]]:
+        """Return the last cached state IDs even if the TTL has expired.
+
+        Callers can use these speculatively while a refresh runs
+        concurrently, since the IDs almost never change in practice.
+        """
+        return self._state_cache
+
+    def _cached_state_ids(self) -> Optional[Tuple[List[str], List[str]]]:
+        if (
+            self._state_cache is not None
+            and self._state_cache_fetched_at is not None
+            and datetime.now() - self._state_cache_fetched_at < self.STATE_CACHE_TTL
+        ):
+            return self._state_cache
+        return None
+
+    async def refresh_state_cache(self) -> Tuple[List[str], List[str]]:
+        """Fetch the shipping-relevant state machine state IDs from Shopware."""
+        # Query the states directly instead of fetching whole state machines
+        # with all their states and filtering client-side - Shopware returns
+        # only the handful of matching states
+        response = await self.make_authenticated_request(
+            "POST", "/search/state-machine-state", json=_SHIPPING_STATE_CRITERIA
+        )
+
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"Error retrieving state machine states: {response.text}"
+            )
+
+        payload = _parse_response(response)
+
+        # Map machine ID -> technical name from the (two-entry) included block
+        machines = {
+            item.get("id"): item.get("attributes", {}).get("technicalName", "")
+            for item in payload.get("included", ())
+            if item.get("type") == "state_machine"
+        }
+
+        state_ids: Tuple[List[str], List[str]] = ([], [])
+        for state in payload.get("data", []):
+            machine_ref = (
+                state.get("relationships", {}).get("stateMachine", {}).get("data") or {}
+            )
+            target = _SHIPPING_STATE_TARGETS.get(
+                (
+                    machines.get(machine_ref.get("id"), ""),
+                    state.get("attributes", {}).get("technicalName", ""),
+                )
+            )
+            if target is not None:
+                state_ids[target].append(state.get("id"))
+
+        paid_transaction_states, open_delivery_states = state_ids
+
+        if not paid_transaction_states or not open_delivery_states:
+            raise RuntimeError("Could not find required state machine state UUIDs")
+
+        self._state_cache = (paid_transaction_states, open_delivery_states)
+        self._state_cache_fetched_at = datetime.now()
+        logger.info("Refreshed shipping state ID cache")
+
+        return self._state_cache
+
+
+class _SyncBatcher:
+    """Coalesces concurrent sync operations into one /_action/sync request.
+
+    Shopware's Sync API accepts any number of operation keys in a single
+    body, so sync calls issued within a short window are merged into one
+    round trip instead of N. The first caller to enqueue becomes the
+    flusher: it sleeps out the window, snapshots everything queued in the
+    meantime and POSTs once, then hands the shared response to every
+    waiter. Operations whose performance headers differ are batched
+    separately, because those headers apply to the whole request. Colliding
+    operation keys are renamed with a numeric suffix so no operation is
+    silently dropped.
+    """
+
+    # Coalescing window in seconds - long enough to catch back-to-back
+    # calls issued concurrently, short enough to be invisible per call
+    WINDOW = 0.01
+
+    def __init__(self, auth: ShopwareAuth):
+        self._auth = auth
+        # One pending batch per distinct header combination:
+        # (indexing_behavior, skip_trigger_flow) -> [(key, operation, future)]
+        self._pending: Dict[
+            Tuple[Optional[str], bool],
+            List[Tuple[str, Dict[str, Any], "asyncio.Future[Any]"]],
+        ] = {}
+
+    async def submit(
+        self,
+        operation_key: str,
+        operation: Dict[str, Any],
+        headers_key: Tuple[Optional[str], bool],
+    ) -> Tuple[httpx.Response, str]:
+        """Enqueue one sync operation and wait for its (response, final key).
+
+        The returned key is the operation key actually sent, which only
+        differs from the requested one when a concurrent call used the
+        same key and it had to be renamed.
+        """
+        future: "asyncio.Future[Tuple[httpx.Response, str]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        batch = self._pending.get(headers_key)
+        if batch is not None:
+            # A flusher is already sleeping out the window - ride along
+            batch.append((operation_key, operation, future))
         else:
+            batch = [(operation_key, operation, future)]
+            self._pending[headers_key] = batch
             try:
-                response_data = response.json()
-                if isinstance(response_data, dict) and "data" in response_data:
-                    data_count = (
-                        len(response_data["data"])
-                        if isinstance(response_data["data"], list)
-                        else 1
-                    )
-                    total = response_data.get("total", "unknown")
-                    api_logger.info(
-                        f"📊 RESPONSE SUMMARY: {data_count} items (total: {total})"
-                    )
-                api_logger.debug(
-                    f"📦 RESPONSE DATA: {json.dumps(response_data, indent=2)}"
-                )
-            except:
-                api_logger.debug(f"📦 RESPONSE DATA: {response.text}")
+                await asyncio.sleep(self.WINDOW)
+            finally:
+                # Runs even when the flusher's own task is cancelled
+                # mid-window: riders are waiting on this batch, and a
+                # batch left behind in _pending would make every later
+                # call with the same headers hang on it forever.
+                # Snapshot ends here: later arrivals open a fresh window
+                # instead of racing the in-flight request.
+                if self._pending.get(headers_key) is batch:
+                    del self._pending[headers_key]
+                # Shield the flush so cancelling the flusher does not
+                # abandon the riders mid-request; the cancellation still
+                # propagates to the flusher itself afterwards
+                await asyncio.shield(self._flush(batch, headers_key))
+        return await future
+
+    async def _flush(
+        self,
+        batch: List[Tuple[str, Dict[str, Any], "asyncio.Future[Any]"]],
+        headers_key: Tuple[Optional[str], bool],
+    ) -> None:
+        """POST one merged payload and distribute the response to waiters."""
+        sync_payload: Dict[str, Dict[str, Any]] = {}
+        waiters: List[Tuple[str, "asyncio.Future[Any]"]] = []
+        for operation_key, operation, future in batch:
+            final_key = operation_key
+            suffix = 2
+            while final_key in sync_payload:
+                final_key = f"{operation_key}-{suffix}"
+                suffix += 1
+            sync_payload[final_key] = operation
+            waiters.append((final_key, future))
+
+        header_pairs = _sync_headers(*headers_key)
+
+        kwargs: Dict[str, Any] = {"json": sync_payload}
+        if header_pairs:
+            kwargs["headers"] = dict(header_pairs)
 
-        return response
+        try:
+            response = await self._auth.make_authenticated_request(
+                "POST", "/_action/sync", **kwargs
+            )
+        except Exception as e:
+            for _, future in waiters:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for final_key, future in waiters:
+            if not future.done():
+                future.set_result((response, final_key))
 
 
 def register_tools(mcp: FastMCP, shopware_auth: ShopwareAuth) -> None:
     """Register all MCP tools with the FastMCP instance"""
 
+    sync_batcher = _SyncBatcher(shopware_auth)
+
+    # (monotonic timestamp, formatted result) for get_available_entities.
+    # The schema document itself is cached on ShopwareAuth; this extra layer
+    # also skips the per-call sort and re-serialization of the entity list.
+    available_entities_cache: Optional[Tuple[float, str]] = None
+
+    async def _search(
+        entity: str,
+        search_criteria: Optional[Union[Dict[str, Any], str]],
+        endpoint_prefix: str,
+        success_template: str,
+        failure_template: str,
+        error_template: str,
+    ) -> str:
+        """Shared criteria handling and request logic for the search tools."""
+        try:
+            # Handle both dict and JSON string inputs
+            criteria, error = _coerce_json_arg("search_criteria", search_criteria)
+            if error is not None:
+                return error
+            if criteria is None:
+                criteria = {}
+
+            # For product searches, add parentId = null filter by default if the
+            # caller provides no narrowing of their own. This matches Shopware
+            # admin panel behavior (showing only parent products, not variants).
+            # Callers passing explicit ids or a post-filter have already scoped
+            # the result set, so layering the parent filter on top would wrongly
+            # exclude variants they asked for.
+            if entity == "product" and not any(
+                key in criteria for key in ("filter", "ids", "post-filter")
+            ):
+                criteria["filter"] = list(_PRODUCT_PARENT_FILTER)
+
+            response = await shopware_auth.make_authenticated_request(
+                "POST", f"{endpoint_prefix}/{entity}", json=criteria
+            )
+
+            # Cold error path first, so the hot path falls straight through
+            if response.status_code != 200:
+                return failure_template.format(
+                    entity=entity, status=response.status_code, text=response.text
+                )
+
+            # Parse only to compute the summary counts; embed the raw
+            # response text instead of re-serializing the parsed dict
+            result = _parse_response(response)
+            return success_template.format(
+                entity=entity,
+                count=len(result.get("data", [])),
+                total=result.get("total", "unknown"),
+                result=response.text,
+            )
+
+        except Exception as e:
+            return error_template.format(entity=entity, error=str(e))
+
     @mcp.tool()
     @log_mcp_call
     async def search_shopware_entities(
@@ -273,44 +942,14 @@ def register_tools(mcp: FastMCP, shopware_auth: ShopwareAuth) -> None:
                 "sort": [{"field": "orderDateTime", "order": "DESC"}]
             }
         """
-        try:
-            # Handle both dict and JSON string inputs
-            criteria: Dict[str, Any]
-            if search_criteria is None:
-                criteria = {}
-            elif isinstance(search_criteria, str):
-                try:
-                    criteria = json.loads(search_criteria)
-                except json.JSONDecodeError as e:
-                    return f"Invalid JSON in search_criteria: {str(e)}"
-            else:
-                criteria = search_criteria
-
-            # For product searches, add parentId = null filter by default if no filters are provided
-            # This matches Shopware admin panel behavior (showing only parent products, not variants)
-            if entity == "product" and "filter" not in criteria:
-                criteria["filter"] = [
-                    {"type": "equals", "field": "parentId", "value": None}
-                ]
-
-            # Use POST /api/search/{entity} endpoint
-            endpoint = f"/search/{entity}"
-
-            response = await shopware_auth.make_authenticated_request(
-                "POST", endpoint, json=criteria
-            )
-
-            if response.status_code == 200:
-                result = response.json()
-                data_count = len(result.get("data", []))
-                total = result.get("total", "unknown")
-
-                return f"Search successful for entity '{entity}'. Retrieved {data_count} items (total: {total}). Result: {result}"
-            else:
-                return f"Search failed for entity '{entity}' with status {response.status_code}: {response.text}"
-
-        except Exception as e:
-            return f"Error searching entity '{entity}': {str(e)}"
+        return await _search(
+            entity,
+            search_criteria,
+            "/search",
+            _SEARCH_SUCCESS,
+            _SEARCH_FAILURE,
+            _SEARCH_ERROR,
+        )
 
     @mcp.tool()
     @log_mcp_call
@@ -336,44 +975,14 @@ def register_tools(mcp: FastMCP, shopware_auth: ShopwareAuth) -> None:
         Returns:
             A list of matching entity IDs
         """
-        try:
-            # Handle both dict and JSON string inputs
-            criteria: Dict[str, Any]
-            if search_criteria is None:
-                criteria = {}
-            elif isinstance(search_criteria, str):
-                try:
-                    criteria = json.loads(search_criteria)
-                except json.JSONDecodeError as e:
-                    return f"Invalid JSON in search_criteria: {str(e)}"
-            else:
-                criteria = search_criteria
-
-            # For product searches, add parentId = null filter by default if no filters are provided
-            # This matches Shopware admin panel behavior (showing only parent products, not variants)
-            if entity == "product" and "filter" not in criteria:
-                criteria["filter"] = [
-                    {"type": "equals", "field": "parentId", "value": None}
-                ]
-
-            # Use POST /api/search-ids/{entity} endpoint
-            endpoint = f"/search-ids/{entity}"
-
-            response = await shopware_auth.make_authenticated_request(
-                "POST", endpoint, json=criteria
-            )
-
-            if response.status_code == 200:
-                result = response.json()
-                data_count = len(result.get("data", []))
-                total = result.get("total", "unknown")
-
-                return f"ID search successful for entity '{entity}'. Found {data_count} matching IDs (total: {total}). Result: {result}"
-            else:
-                return f"ID search failed for entity '{entity}' with status {response.status_code}: {response.text}"
-
-        except Exception as e:
-            return f"Error searching entity IDs for '{entity}': {str(e)}"
+        return await _search(
+            entity,
+            search_criteria,
+            "/search-ids",
+            _SEARCH_IDS_SUCCESS,
+            _SEARCH_IDS_FAILURE,
+            _SEARCH_IDS_ERROR,
+        )
 
     @mcp.tool()
     @log_mcp_call
@@ -405,36 +1014,105 @@ def register_tools(mcp: FastMCP, shopware_auth: ShopwareAuth) -> None:
         """
         try:
             # Handle both dict and JSON string inputs for associations
-            if associations is not None and isinstance(associations, str):
-                try:
-                    associations = json.loads(associations)
-                except json.JSONDecodeError as e:
-                    return f"Invalid JSON in associations: {str(e)}"
+            associations, error = _coerce_json_arg("associations", associations)
+            if error is not None:
+                return error
 
             # Use GET /api/{entity}/{id} endpoint
             endpoint = f"/{entity}/{entity_id}"
 
-            # Add associations as query parameters if provided
+            # Shopware expects associations as a JSON string in query params
+            # for GET requests; only serialize when there is something to
+            # send. httpx treats an empty dict the same as no params.
             params = {}
             if associations:
-                # Shopware expects associations as a JSON string in query params for GET requests
-                params["associations"] = json.dumps(associations)
+                params["associations"] = orjson.dumps(associations).decode()
 
             response = await shopware_auth.make_authenticated_request(
-                "GET", endpoint, params=params if params else None
+                "GET", endpoint, params=params
             )
 
-            if response.status_code == 200:
-                result = response.json()
-                return f"Successfully retrieved {entity} with ID '{entity_id}'. Result: {result}"
-            elif response.status_code == 404:
+            if response.status_code == 404:
                 return f"Entity '{entity}' with ID '{entity_id}' not found."
-            else:
+            if response.status_code != 200:
                 return f"Failed to retrieve {entity} with ID '{entity_id}'. Status {response.status_code}: {response.text}"
 
+            return f"Successfully retrieved {entity} with ID '{entity_id}'. Result: {response.text}"
+
         except Exception as e:
             return f"Error retrieving {entity} with ID '{entity_id}': {str(e)}"
 
+    @mcp.tool()
+    @log_mcp_call
+    async def get_shopware_entities_by_ids(
+        entity: str,
+        entity_ids: List[str],
+        associations: Optional[Union[Dict[str, Any], str]] = None,
+    ) -> str:
+        """Fetch multiple Shopware entities by their IDs concurrently.
+
+        Instead of issuing one get_shopware_entity_by_id call per entity,
+        this tool dispatches all detail requests at once over the pooled
+        HTTP client, so total latency is close to a single request rather
+        than the sum of all of them.
+
+        Args:
+            entity: The entity name (same entities as search_shopware_entities)
+            entity_ids: The unique IDs of the entities to fetch
+            associations: Optional associations to load with each entity (dict or JSON string, same format as in search criteria)
+
+        Example usage:
+            # Fetch several orders in one call
+            get_shopware_entities_by_ids("order", ["id-1", "id-2", "id-3"])
+        """
+        try:
+            # Handle both dict and JSON string inputs for associations
+            associations, error = _coerce_json_arg("associations", associations)
+            if error is not None:
+                return error
+
+            # Only serialize associations when there is something to send;
+            # httpx treats an empty dict the same as no params
+            params = {}
+            if associations:
+                params["associations"] = orjson.dumps(associations).decode()
+
+            # All requests overlap on the pooled client instead of running
+            # back-to-back; failures are collected per ID
+            responses = await asyncio.gather(
+                *(
+                    shopware_auth.make_authenticated_request(
+                        "GET", f"/{entity}/{entity_id}", params=params
+                    )
+                    for entity_id in entity_ids
+                ),
+                return_exceptions=True,
+            )
+
+            results = []
+            errors = []
+            for entity_id, response in zip(entity_ids, responses):
+                if isinstance(response, BaseException):
+                    errors.append(f"{entity_id}: {response}")
+                elif response.status_code == 200:
+                    results.append(response.text)
+                elif response.status_code == 404:
+                    errors.append(f"{entity_id}: not found")
+                else:
+                    errors.append(
+                        f"{entity_id}: status {response.status_code}: {response.text}"
+                    )
+
+            summary = (
+                f"Retrieved {len(results)} of {len(entity_ids)} '{entity}' entities."
+            )
+            if errors:
+                summary += f" Errors: {'; '.join(errors)}"
+            return f"{summary} Results: [{', '.join(results)}]"
+
+        except Exception as e:
+            return f"Error retrieving {entity} entities by IDs: {str(e)}"
+
     @mcp.tool()
     @log_mcp_call
     async def shopware_get_request(
@@ -467,26 +1145,21 @@ def register_tools(mcp: FastMCP, shopware_auth: ShopwareAuth) -> None:
         """
         try:
             # Handle both dict and JSON string inputs for params
-            if params is not None and isinstance(params, str):
-                try:
-                    params = json.loads(params)
-                except json.JSONDecodeError as e:
-                    return f"Invalid JSON in params: {str(e)}"
+            params, error = _coerce_json_arg("params", params)
+            if error is not None:
+                return error
 
-            # Ensure endpoint starts with /
-            if not endpoint.startswith("/"):
-                endpoint = "/" + endpoint
+            endpoint = _normalize_endpoint(endpoint)
 
             response = await shopware_auth.make_authenticated_request(
                 "GET", endpoint, params=params
             )
 
-            if response.status_code == 200:
-                result = response.json()
-                return f"GET request successful for endpoint '{endpoint}'. Result: {result}"
-            else:
+            if response.status_code != 200:
                 return f"GET request failed for endpoint '{endpoint}' with status {response.status_code}: {response.text}"
 
+            return f"GET request successful for endpoint '{endpoint}'. Result: {response.text}"
+
         except Exception as e:
             return f"Error making GET request to '{endpoint}': {str(e)}"
 
@@ -522,32 +1195,25 @@ def register_tools(mcp: FastMCP, shopware_auth: ShopwareAuth) -> None:
         """
         try:
             # Handle both dict and JSON string inputs
-            if data is not None and isinstance(data, str):
-                try:
-                    data = json.loads(data)
-                except json.JSONDecodeError as e:
-                    return f"Invalid JSON in data: {str(e)}"
+            data, error = _coerce_json_arg("data", data)
+            if error is not None:
+                return error
 
-            if params is not None and isinstance(params, str):
-                try:
-                    params = json.loads(params)
-                except json.JSONDecodeError as e:
-                    return f"Invalid JSON in params: {str(e)}"
+            params, error = _coerce_json_arg("params", params)
+            if error is not None:
+                return error
 
-            # Ensure endpoint starts with /
-            if not endpoint.startswith("/"):
-                endpoint = "/" + endpoint
+            endpoint = _normalize_endpoint(endpoint)
 
             response = await shopware_auth.make_authenticated_request(
                 "POST", endpoint, json=data, params=params
             )
 
-            if response.status_code in [200, 201]:
-                result = response.json()
-                return f"POST request successful for endpoint '{endpoint}'. Result: {result}"
-            else:
+            if response.status_code not in (200, 201):
                 return f"POST request failed for endpoint '{endpoint}' with status {response.status_code}: {response.text}"
 
+            return f"POST request successful for endpoint '{endpoint}'. Result: {response.text}"
+
         except Exception as e:
             return f"Error making POST request to '{endpoint}': {str(e)}"
 
@@ -567,48 +1233,36 @@ def register_tools(mcp: FastMCP, shopware_auth: ShopwareAuth) -> None:
             The OpenAPI schema definition for the specified entity including all endpoints and schemas
         """
         try:
-            # Get the full OpenAPI schema
-            response = await shopware_auth.make_authenticated_request(
-                "GET", "/_info/openapi3.json"
-            )
-
-            if response.status_code != 200:
-                return f"Failed to fetch OpenAPI schema with status {response.status_code}: {response.text}"
-
-            openapi_data = response.json()
-
-            # Find paths related to the entity
-            entity_paths = {}
-            entity_schemas = {}
-
-            # Convert entity name to different formats used in OpenAPI
-            entity_kebab = entity.lower().replace("_", "-")
+            # Get the full OpenAPI schema (cached with a TTL on the auth
+            # object, so only the first call per hour pays the download)
+            openapi_data = await shopware_auth.get_cached_schema("/_info/openapi3.json")
+
+            # Convert entity name to different formats used in OpenAPI,
+            # lowercased once up front instead of per compared item
+            entity_l = entity.lower()
+            entity_kebab = entity_l.replace("_", "-")
             entity_pascal = "".join(
                 word.capitalize() for word in entity.replace("-", "_").split("_")
             )
 
-            # Search for paths
+            # Find paths related to the entity in a single pass; the
+            # lowercased substring checks subsume the previous
+            # case-sensitive leading-slash checks
             paths = openapi_data.get("paths", {})
-            for path, path_data in paths.items():
-                # Check if path is related to the entity
-                if (
-                    f"/{entity_kebab}" in path
-                    or f"/{entity}" in path
-                    or entity_kebab in path.lower()
-                    or entity in path.lower()
-                ):
-                    entity_paths[path] = path_data
+            entity_paths = {
+                path: path_data
+                for path, path_data in paths.items()
+                if entity_kebab in (path_l := path.lower()) or entity_l in path_l
+            }
 
-            # Search for schemas
-            components = openapi_data.get("components", {})
-            schemas = components.get("schemas", {})
-            for schema_name, schema_data in schemas.items():
-                if (
-                    schema_name.lower() == entity_pascal.lower()
-                    or schema_name.lower() == entity_kebab.lower()
-                    or schema_name.lower() == entity.lower()
-                ):
-                    entity_schemas[schema_name] = schema_data
+            # Find schemas whose name matches any accepted spelling
+            schema_targets = {entity_pascal.lower(), entity_kebab, entity_l}
+            schemas = openapi_data.get("components", {}).get("schemas", {})
+            entity_schemas = {
+                name: data
+                for name, data in schemas.items()
+                if name.lower() in schema_targets
+            }
 
             if not entity_paths and not entity_schemas:
                 return f"No OpenAPI schema found for entity '{entity}'. Available entities can be found using get_available_entities tool."
@@ -620,7 +1274,8 @@ def register_tools(mcp: FastMCP, shopware_auth: ShopwareAuth) -> None:
             }
 
             return (
-                f"OpenAPI schema for entity '{entity}': {json.dumps(result, indent=2)}"
+                f"OpenAPI schema for entity '{entity}': "
+                f"{orjson.dumps(result).decode()}"
             )
 
         except Exception as e:
@@ -641,41 +1296,28 @@ def register_tools(mcp: FastMCP, shopware_auth: ShopwareAuth) -> None:
             The entity definition including properties, types, and relationships
         """
         try:
-            # Get the entity definitions schema
-            response = await shopware_auth.make_authenticated_request(
-                "GET", "/_info/open-api-schema.json"
-            )
-
-            if response.status_code != 200:
-                return f"Failed to fetch entity definitions with status {response.status_code}: {response.text}"
+            # Get the entity definitions schema (cached with a TTL on the
+            # auth object) plus the normalized-name index, so the lookup is
+            # a single dict hit instead of a scan over every key
+            schema_data, index = await shopware_auth.get_entity_definitions()
 
-            schema_data = response.json()
+            real_key = index.get(entity.lower().replace("-", "_"))
+            if real_key is None:
+                return f"Entity definition not found for '{entity}'. Available entities can be found using get_available_entities tool."
 
-            # Convert entity name to match the schema format
-            entity_key = entity.lower().replace("_", "-")
+            entity_definition = schema_data[real_key]
+            result = {"entity": entity, "definition": entity_definition}
 
-            # Look for the entity in the schema
-            if entity_key in schema_data:
-                entity_definition = schema_data[entity_key]
-                result = {"entity": entity, "definition": entity_definition}
+            # Same distinction as before: report when the entity name only
+            # matched after normalization
+            if real_key == entity.lower().replace("_", "-"):
                 return (
-                    f"Entity definition for '{entity}': {json.dumps(result, indent=2)}"
+                    f"Entity definition for '{entity}': "
+                    f"{orjson.dumps(result).decode()}"
                 )
 
-            # If not found, try alternative formats
-            for key in schema_data.keys():
-                if key.lower() == entity.lower() or key.lower().replace(
-                    "-", "_"
-                ) == entity.lower().replace("-", "_"):
-                    entity_definition = schema_data[key]
-                    result = {
-                        "entity": entity,
-                        "definition": entity_definition,
-                        "matched_key": key,
-                    }
-                    return f"Entity definition for '{entity}' (matched as '{key}'): {json.dumps(result, indent=2)}"
-
-            return f"Entity definition not found for '{entity}'. Available entities can be found using get_available_entities tool."
+            result["matched_key"] = real_key
+            return f"Entity definition for '{entity}' (matched as '{real_key}'): {orjson.dumps(result).decode()}"
 
         except Exception as e:
             return f"Error getting entity definition for entity '{entity}': {str(e)}"
@@ -711,38 +1353,42 @@ def register_tools(mcp: FastMCP, shopware_auth: ShopwareAuth) -> None:
             shopware_patch_request('/customer/customer-id', data)
         """
         try:
-            # Handle both dict and JSON string inputs
-            if data is not None and isinstance(data, str):
+            # String bodies are validated as JSON but sent as their original
+            # bytes, skipping the parse-then-reserialize round trip; dicts
+            # (the common case) are serialized once by the request layer
+            body_kwargs: Dict[str, Any] = {}
+            if isinstance(data, str):
                 try:
-                    data = json.loads(data)
-                except json.JSONDecodeError as e:
+                    orjson.loads(data)
+                except orjson.JSONDecodeError as e:
                     return f"Invalid JSON in data: {str(e)}"
+                body_kwargs["content"] = data.encode()
+            elif data is not None:
+                body_kwargs["json"] = data
 
-            if params is not None and isinstance(params, str):
-                try:
-                    params = json.loads(params)
-                except json.JSONDecodeError as e:
-                    return f"Invalid JSON in params: {str(e)}"
+            params, error = _coerce_json_arg("params", params)
+            if error is not None:
+                return error
 
-            # Ensure endpoint starts with /
-            if not endpoint.startswith("/"):
-                endpoint = "/" + endpoint
+            endpoint = _normalize_endpoint(endpoint)
 
             response = await shopware_auth.make_authenticated_request(
-                "PATCH", endpoint, json=data, params=params
+                "PATCH", endpoint, params=params, **body_kwargs
             )
 
-            if response.status_code in [200, 204]:
-                if response.status_code == 204:
-                    return f"PATCH request successful for endpoint '{endpoint}'. Entity updated (no content returned)."
-                else:
-                    result = response.json()
-                    return f"PATCH request successful for endpoint '{endpoint}'. Result: {result}"
-            else:
-                return f"PATCH request failed for endpoint '{endpoint}' with status {response.status_code}: {response.text}"
+            if response.status_code not in (200, 204):
+                return _PATCH_FAILURE.format(
+                    endpoint=endpoint, status=response.status_code, text=response.text
+                )
+
+            if response.status_code == 204:
+                return _PATCH_OK_204.format(endpoint=endpoint)
+
+            result = _parse_response(response)
+            return _PATCH_OK.format(endpoint=endpoint, result=result)
 
         except Exception as e:
-            return f"Error making PATCH request to '{endpoint}': {str(e)}"
+            return _PATCH_ERROR.format(endpoint=endpoint, error=str(e))
 
     @mcp.tool()
     @log_mcp_call
@@ -774,31 +1420,29 @@ def register_tools(mcp: FastMCP, shopware_auth: ShopwareAuth) -> None:
         """
         try:
             # Handle both dict and JSON string inputs for params
-            if params is not None and isinstance(params, str):
-                try:
-                    params = json.loads(params)
-                except json.JSONDecodeError as e:
-                    return f"Invalid JSON in params: {str(e)}"
+            params, error = _coerce_json_arg("params", params)
+            if error is not None:
+                return error
 
-            # Ensure endpoint starts with /
-            if not endpoint.startswith("/"):
-                endpoint = "/" + endpoint
+            endpoint = _normalize_endpoint(endpoint)
 
             response = await shopware_auth.make_authenticated_request(
                 "DELETE", endpoint, params=params
             )
 
-            if response.status_code in [200, 204]:
-                if response.status_code == 204:
-                    return f"DELETE request successful for endpoint '{endpoint}'. Entity deleted successfully."
-                else:
-                    result = response.json()
-                    return f"DELETE request successful for endpoint '{endpoint}'. Result: {result}"
-            else:
-                return f"DELETE request failed for endpoint '{endpoint}' with status {response.status_code}: {response.text}"
+            if response.status_code not in (200, 204):
+                return _DELETE_FAILURE.format(
+                    endpoint=endpoint, status=response.status_code, text=response.text
+                )
+
+            if response.status_code == 204:
+                return _DELETE_OK_204.format(endpoint=endpoint)
+
+            result = _parse_response(response)
+            return _DELETE_OK.format(endpoint=endpoint, result=result)
 
         except Exception as e:
-            return f"Error making DELETE request to '{endpoint}': {str(e)}"
+            return _DELETE_ERROR.format(endpoint=endpoint, error=str(e))
 
     @mcp.tool()
     @log_mcp_call
@@ -900,6 +1544,21 @@ def register_tools(mcp: FastMCP, shopware_auth: ShopwareAuth) -> None:
         The sync API is transactional - if one operation fails, the entire request is rolled back.
         Check the response for details about created, updated, or deleted entities.
 
+        **Call Coalescing**:
+        Sync calls issued within a ~10ms window are merged into a single
+        /_action/sync request (calls with different indexing/flow settings are
+        kept apart, and colliding operation keys get a numeric suffix). All
+        coalesced calls share one transaction and one response: a failure in
+        any merged operation fails them all, and the reported data/notFound/
+        deleted counts cover the whole merged request, not just this call's
+        operation.
+
+        **Large Payloads**:
+        Payloads larger than SHOPWARE_SYNC_CHUNK items (default 500) are split into
+        separate sub-syncs issued concurrently, each with a numbered operation key
+        suffix. Each chunk is transactional on its own, so one failing chunk does
+        not roll back the others - the result reports which chunks failed.
+
         Examples:
             # Create multiple products (basic)
             shopware_sync_operation("product", "upsert", [
@@ -936,20 +1595,17 @@ def register_tools(mcp: FastMCP, shopware_auth: ShopwareAuth) -> None:
         """
         try:
             # Handle JSON string input
-            if isinstance(payload, str):
-                try:
-                    payload = json.loads(payload)
-                except json.JSONDecodeError as e:
-                    return f"Invalid JSON in payload: {str(e)}"
+            payload, error = _coerce_json_arg("payload", payload)
+            if error is not None:
+                return error
 
             # Validate action
-            if action not in ["upsert", "delete"]:
+            if action not in _VALID_SYNC_ACTIONS:
                 return f"Invalid action '{action}'. Must be 'upsert' or 'delete'."
 
             # Validate indexing_behavior
-            valid_indexing_behaviors = [None, "use-queue-indexing", "disable-indexing"]
-            if indexing_behavior not in valid_indexing_behaviors:
-                return f"Invalid indexing_behavior '{indexing_behavior}'. Must be one of: {valid_indexing_behaviors}"
+            if indexing_behavior not in _VALID_INDEXING_BEHAVIORS:
+                return f"Invalid indexing_behavior '{indexing_behavior}'. Must be one of: [None, 'use-queue-indexing', 'disable-indexing']"
 
             # Validate payload is a list
             if not isinstance(payload, list):
@@ -959,61 +1615,135 @@ def register_tools(mcp: FastMCP, shopware_auth: ShopwareAuth) -> None:
             if operation_key is None:
                 operation_key = f"{action}-{entity}"
 
-            # Construct sync payload
-            sync_payload = {
-                operation_key: {"entity": entity, "action": action, "payload": payload}
-            }
-
-            # Prepare additional headers for performance optimization
-            extra_headers: Dict[str, str] = {}
-            if indexing_behavior is not None:
-                extra_headers["indexing-behavior"] = indexing_behavior
+            # Add performance info to response
+            perf_info = []
+            if indexing_behavior:
+                perf_info.append(f"indexing: {indexing_behavior}")
             if skip_trigger_flow:
-                extra_headers["sw-skip-trigger-flow"] = "1"
+                perf_info.append("flows: skipped")
+            perf_text = f" (Performance: {', '.join(perf_info)})" if perf_info else ""
+
+            # Very large payloads are split into bounded sub-syncs issued
+            # concurrently (the request semaphore caps the fan-out). This
+            # keeps each request below practical body-size limits and
+            # isolates failures: each chunk is transactional on its own.
+            # The chunks bypass the coalescer on purpose - it would merge
+            # them straight back into one giant body.
+            build_operation = _sync_operation_builder(entity, action)
+
+            chunk_size = int(os.getenv("SHOPWARE_SYNC_CHUNK", "500"))
+            if len(payload) > chunk_size:
+                header_pairs = _sync_headers(indexing_behavior, skip_trigger_flow)
+
+                async def run_chunk(index: int, start: int) -> httpx.Response:
+                    chunk_kwargs: Dict[str, Any] = {
+                        "json": {
+                            f"{operation_key}-{index}": build_operation(
+                                payload[start : start + chunk_size]
+                            )
+                        }
+                    }
+                    if header_pairs:
+                        chunk_kwargs["headers"] = dict(header_pairs)
+                    return await shopware_auth.make_authenticated_request(
+                        "POST", "/_action/sync", **chunk_kwargs
+                    )
 
-            # Make request to sync endpoint with performance headers
-            kwargs: Dict[str, Any] = {"json": sync_payload}
-            if extra_headers:
-                kwargs["headers"] = extra_headers
+                responses = await asyncio.gather(
+                    *(
+                        run_chunk(index, start)
+                        for index, start in enumerate(
+                            range(0, len(payload), chunk_size), start=1
+                        )
+                    )
+                )
 
-            response = await shopware_auth.make_authenticated_request(
-                "POST", "/_action/sync", **kwargs
+                data_count = 0
+                not_found_count = 0
+                deleted_count = 0
+                failures = []
+                for index, chunk_response in enumerate(responses, start=1):
+                    if chunk_response.status_code not in (200, 201):
+                        failures.append(
+                            f"chunk {index} failed with status "
+                            f"{chunk_response.status_code}: "
+                            f"{chunk_response.text[:4096]}"
+                        )
+                        continue
+                    chunk_result = _parse_response(chunk_response)
+                    for entity_data in chunk_result.get("data", {}).values():
+                        data_count += (
+                            len(entity_data) if isinstance(entity_data, list) else 1
+                        )
+                    not_found_count += len(chunk_result.get("notFound", []))
+                    deleted_count += len(chunk_result.get("deleted", []))
+
+                chunked_summary = (
+                    f"Sync operation '{operation_key}' split into "
+                    f"{len(responses)} chunks of up to {chunk_size} items; "
+                    f"{len(responses) - len(failures)} of {len(responses)} "
+                    f"succeeded. Data items: {data_count}, "
+                    f"Not found: {not_found_count}, Deleted: {deleted_count}."
+                    f"{perf_text}"
+                )
+                if failures:
+                    chunked_summary += " Failures: " + "; ".join(failures)
+                return chunked_summary
+
+            # Concurrent sync calls within the coalescing window share one
+            # /_action/sync round trip; the batcher builds the merged
+            # payload and the performance headers. The returned key may
+            # carry a suffix if a concurrent call used the same key.
+            response, operation_key = await sync_batcher.submit(
+                operation_key,
+                build_operation(payload),
+                (indexing_behavior, skip_trigger_flow),
             )
 
-            if response.status_code in [200, 201]:
-                result = response.json()
-
-                # Extract key information from response
-                data = result.get("data", {})
-                not_found = result.get("notFound", [])
-                deleted = result.get("deleted", [])
-
-                summary = []
-                if data:
-                    for entity_type, entity_data in data.items():
-                        if isinstance(entity_data, list):
-                            summary.append(f"{entity_type}: {len(entity_data)} items")
-                        else:
-                            summary.append(f"{entity_type}: 1 item")
-
-                summary_text = "; ".join(summary) if summary else "No data returned"
-
-                # Add performance info to response
-                perf_info = []
-                if indexing_behavior:
-                    perf_info.append(f"indexing: {indexing_behavior}")
-                if skip_trigger_flow:
-                    perf_info.append("flows: skipped")
-                perf_text = (
-                    f" (Performance: {', '.join(perf_info)})" if perf_info else ""
+            if response.status_code not in (200, 201):
+                # A failed bulk sync can echo back megabytes of payload -
+                # the first 4 KiB carry the actual error details
+                error_text = response.text[:4096]
+                if len(response.text) > 4096:
+                    error_text += "... (truncated)"
+                return _SYNC_FAILURE.format(
+                    status=response.status_code, text=error_text
+                )
+
+            result = _parse_response(response)
+
+            # Extract key information from response
+            data = result.get("data", {})
+            not_found = result.get("notFound", [])
+            deleted = result.get("deleted", [])
+
+            summary_text = (
+                "; ".join(
+                    (
+                        f"{entity_type}: {len(entity_data)} items"
+                        if isinstance(entity_data, list)
+                        else f"{entity_type}: 1 item"
+                    )
+                    for entity_type, entity_data in data.items()
                 )
+                or "No data returned"
+            )
 
-                return f"Sync operation '{operation_key}' successful. {summary_text}. Not found: {len(not_found)}, Deleted: {len(deleted)}.{perf_text} Full result: {result}"
+            # Echoing a huge result back to the model burns tokens without
+            # adding information beyond the per-entity counts above - only
+            # include the full body when it is small
+            if len(response.content) < 16384:
+                result_text = f" Full result: {orjson.dumps(result).decode()}"
             else:
-                return f"Sync operation failed with status {response.status_code}: {response.text}"
+                result_text = (
+                    f" Full result omitted ({len(response.content)} bytes);"
+                    " counts above summarize the response."
+                )
+
+            return f"Sync operation '{operation_key}' successful. {summary_text}. Not found: {len(not_found)}, Deleted: {len(deleted)}.{perf_text}{result_text}"
 
         except Exception as e:
-            return f"Error executing sync operation for entity '{entity}': {str(e)}"
+            return _SYNC_ERROR.format(entity=entity, error=str(e))
 
     @mcp.tool()
     @log_mcp_call
@@ -1026,24 +1756,49 @@ def register_tools(mcp: FastMCP, shopware_auth: ShopwareAuth) -> None:
         Returns:
             A list of all available entity names in the Shopware system
         """
+        nonlocal available_entities_cache
         try:
-            # Get the entity definitions schema
+            # The entity list changes only on plugin (de)installation, yet
+            # exploring agents call this tool repeatedly - serve the fully
+            # formatted string from cache while it is fresh
+            if (
+                available_entities_cache is not None
+                and time.monotonic() - available_entities_cache[0]
+                < AVAILABLE_ENTITIES_TTL
+            ):
+                return available_entities_cache[1]
+
+            # Cold start: revalidate against the persisted ETag so an
+            # unchanged schema costs a zero-payload 304 instead of a
+            # megabyte-scale download
+            etag, cached_entities = _load_entity_disk_cache()
+            request_kwargs: Dict[str, Any] = {}
+            if etag is not None and cached_entities is not None:
+                request_kwargs["headers"] = {"If-None-Match": etag}
+
             response = await shopware_auth.make_authenticated_request(
-                "GET", "/_info/open-api-schema.json"
+                "GET", "/_info/open-api-schema.json", **request_kwargs
             )
 
-            if response.status_code != 200:
+            if response.status_code == 304 and cached_entities is not None:
+                entity_names = cached_entities
+            elif response.status_code == 200:
+                schema_data = _parse_response(response)
+                entity_names = sorted(schema_data.keys())
+                response_etag = response.headers.get("etag")
+                if response_etag:
+                    _store_entity_disk_cache(response_etag, entity_names)
+            else:
                 return f"Failed to fetch entity definitions with status {response.status_code}: {response.text}"
 
-            schema_data = response.json()
-
-            # Extract all entity names
-            entity_names = list(schema_data.keys())
-            entity_names.sort()  # Sort alphabetically for easier reading
-
             result = {"total_entities": len(entity_names), "entities": entity_names}
 
-            return f"Available entities ({len(entity_names)} total): {json.dumps(result, indent=2)}"
+            formatted = (
+                f"Available entities ({len(entity_names)} total): "
+                f"{orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()}"
+            )
+            available_entities_cache = (time.monotonic(), formatted)
+            return formatted
 
         except Exception as e:
             return f"Error getting available entities: {str(e)}"